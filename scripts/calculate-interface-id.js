@@ -1,20 +1,6 @@
 const { ethers } = require("hardhat");
 
 async function main() {
-    // Get signers
-    const [owner] = await ethers.getSigners();
-
-    // Get the IERC1450 interface
-    const IERC1450 = await ethers.getContractFactory("ERC1450");
-    const token = await IERC1450.deploy(
-        "Test",
-        "TEST",
-        18,
-        owner.address,
-        owner.address
-    );
-    await token.waitForDeployment();
-
     // List of functions that are part of IERC1450 interface
     // (excluding functions inherited from IERC20, IERC165)
     // Updated for single fee token design (December 2024)
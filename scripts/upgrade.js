@@ -1,6 +1,5 @@
 const { ethers, upgrades, network } = require("hardhat");
 const fs = require('fs');
-const path = require('path');
 
 /**
  * Upgrade Script for ERC-1450 Upgradeable Contracts